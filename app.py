@@ -1,7 +1,9 @@
-from flask import Flask, render_template, request, send_file, jsonify
+from flask import Flask, render_template, request, send_file, jsonify, abort
 import io
 import json
+import os
 from docx_generator import generate_exam_docx
+from static_cache import AssetRegistry, CachedBody
 
 app = Flask(__name__)
 
@@ -38,13 +40,33 @@ SUBJECTS = [
     {"name": "Mathematics Basic", "code": "241"},
 ]
 
+assets = AssetRegistry(app.static_folder, ['css/app.css', 'js/app.js'])
+subjects_body = CachedBody(json.dumps(SUBJECTS, separators=(',', ':')).encode('utf-8'), 'application/json')
+index_body = None
+
+@app.context_processor
+def inject_asset_url():
+    return {'asset_url': assets.url_for}
+
 @app.route('/')
 def index():
-    return render_template('index.html', subjects=SUBJECTS)
+    # The page has no per-request data, so render it once and revalidate by ETag.
+    global index_body
+    if index_body is None:
+        html = render_template('index.html', subjects=SUBJECTS)
+        index_body = CachedBody(html.encode('utf-8'), 'text/html')
+    return index_body.response('no-cache')
+
+@app.route('/assets/<path:filename>')
+def static_asset(filename):
+    resp = assets.response(filename)
+    if resp is None:
+        abort(404)
+    return resp
 
 @app.route('/api/subjects')
 def get_subjects():
-    return jsonify(SUBJECTS)
+    return subjects_body.response('no-cache')
 
 @app.route('/api/paper/generate', methods=['POST'])
 def generate_paper():
@@ -69,4 +91,6 @@ def generate_paper():
         return jsonify({'error': str(e), 'trace': traceback.format_exc()}), 500
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
+    # Pages and assets are cached in memory, so restart on CSS/JS/template edits too.
+    template = os.path.join(app.root_path, app.template_folder, 'index.html')
+    app.run(debug=True, port=5000, extra_files=assets.paths + [template])
@@ -0,0 +1,683 @@
+'use strict';
+// ════════════════════════════════════════════
+// STATE
+// ════════════════════════════════════════════
+let sections = [], instrs = [], secUid = 0;
+let ms = { suid: null, editIdx: null, qtype: 'mcq' };  // modal state
+
+const QT = [
+  {k:'mcq',  l:'MCQ',             i:'🔘'},
+  {k:'vsa',  l:'Very Short',      i:'✏️'},
+  {k:'sa',   l:'Short Answer',    i:'📝'},
+  {k:'la',   l:'Long Answer',     i:'📖'},
+  {k:'fill_blanks', l:'Fill Blanks', i:'✒️'},
+  {k:'match',l:'Match List',      i:'↔️'},
+  {k:'tf',   l:'True/False',      i:'✓✗'},
+  {k:'ar',   l:'Assertion-Reason',i:'⚖️'},
+  {k:'comp', l:'Comprehension',   i:'📄'},
+  {k:'case', l:'Case-Based',      i:'📊'},
+  {k:'num',  l:'Numerical',       i:'🔢'},
+  {k:'def',  l:'Definition',      i:'📌'},
+];
+const PRESETS = [
+  'All questions are compulsory.',
+  'The question paper is divided into sections A, B, C and D.',
+  'There is no overall choice. However, internal choice has been provided.',
+  'Use of calculator is not allowed.',
+  'Draw neat and labelled diagrams wherever necessary.',
+  'All parts of a question should be attempted at one place.',
+  'Marks for each question are indicated at the right margin.',
+  'Write legibly and to the point.',
+  'Read all questions carefully before answering.',
+  'Figures in the margin indicate full marks for each question.',
+];
+
+// ════════════════════════════════════════════
+// UTILS
+// ════════════════════════════════════════════
+const E = s => s == null ? '' : String(s).replace(/&/g,'&amp;').replace(/</g,'&lt;').replace(/>/g,'&gt;').replace(/"/g,'&quot;');
+const $ = id => document.getElementById(id);
+const getSec = uid => sections.find(s => s._uid === uid);
+const qtl = k => (QT.find(t => t.k === k)||{l:k}).l;
+const qti = k => (QT.find(t => t.k === k)||{i:'?'}).i;
+
+function toast(msg, type='') {
+  const t = $('toast');
+  t.textContent = msg; t.className = 'toast show' + (type?' '+type:'');
+  clearTimeout(t._t); t._t = setTimeout(() => t.classList.remove('show'), 2600);
+}
+
+function getMaxMarks() {
+  const v = $('maxMarks').value;
+  return v==='custom' ? (parseFloat($('custMarks').value)||0) : (parseFloat(v)||0);
+}
+function getDurMins() {
+  const v = $('duration').value;
+  return v==='custom' ? (parseInt($('custDur').value)||0) : (parseInt(v)||0);
+}
+function durStr(m) {
+  if (!m) return '';
+  m = parseInt(m);
+  if (m===60) return '1 Hour'; if (m===90) return '1.5 Hours';
+  if (m===120) return '2 Hours'; if (m===180) return '3 Hours';
+  return m % 60 === 0 ? (m/60)+' Hours' : m+' Minutes';
+}
+function fmtQNum(n, style) {
+  if (!style || style==='1, 2, 3...') return n+'.';
+  if (style==='Q1, Q2, Q3...') return 'Q'+n+'.';
+  const R=['','i','ii','iii','iv','v','vi','vii','viii','ix','x','xi','xii','xiii','xiv','xv','xvi','xvii','xviii','xix','xx'];
+  if (style==='i, ii, iii...') return (R[n]||n)+'.';
+  if (style==='(a), (b), (c)...') return '('+String.fromCharCode(96+n)+')';
+  return n+'.';
+}
+
+// ════════════════════════════════════════════
+// NAVIGATION
+// ════════════════════════════════════════════
+function showStep(n) {
+  document.querySelectorAll('.pane').forEach((p,i) => p.classList.toggle('active', i+1===n));
+  [1,2,3,4].forEach(i => {
+    const nav = $('nav'+i), ns = $('ns'+i);
+    nav.className = 'nav-item' + (i===n?' active':(i<n?' done':''));
+    ns.textContent = i<n ? '✓' : i;
+  });
+  if (n===4) renderPreview();
+}
+
+// ════════════════════════════════════════════
+// STATS
+// ════════════════════════════════════════════
+function updateStats() {
+  const totalQ = sections.reduce((s,sec)=>s+(sec.questions||[]).length,0);
+  const usedM = sections.reduce((s,sec)=>s+(parseFloat(sec.totalMarks)||0),0);
+  const maxM = getMaxMarks();
+  $('s-sec').textContent = sections.length;
+  $('s-q').textContent = totalQ;
+  $('s-m').textContent = usedM;
+  $('s-mm').textContent = maxM||'—';
+  $('s-m').className = 'sb-stat-val'+(maxM&&usedM>maxM?' marks-over':usedM===maxM&&maxM?' marks-full':'');
+  const mbw = $('mb-wrap');
+  if (maxM>0) {
+    mbw.style.display='block';
+    const pct=Math.min(100,Math.round(usedM/maxM*100));
+    $('mb-fill').style.width=pct+'%';
+    $('mb-label').textContent=pct+'% assigned';
+  } else mbw.style.display='none';
+}
+function autoFillCode() {
+  const sel=$('subject'), opt=sel.options[sel.selectedIndex];
+  if (opt&&opt.dataset.code) $('subjectCode').value=opt.dataset.code;
+}
+function toggleCust(t) {
+  if (t==='Marks') $('custMarksG').style.display=$('maxMarks').value==='custom'?'flex':'none';
+  else $('custDurG').style.display=$('duration').value==='custom'?'flex':'none';
+}
+
+// ════════════════════════════════════════════
+// SECTIONS
+// ════════════════════════════════════════════
+function addSection() {
+  const LETTERS='ABCDEFGHIJKLMNOPQRSTUVWXYZ';
+  const uid=++secUid;
+  const sec={_uid:uid,id:LETTERS[sections.length]||String(sections.length+1),name:'',totalMarks:'',instructions:'',questionNumberStyle:'1, 2, 3...',enabled:true,questions:[],_open:true};
+  sections.push(sec);
+  reLetter();
+  insertSecCard(sec);
+  updateStats();
+  setTimeout(()=>{const el=$('sec-'+uid);if(el)el.scrollIntoView({behavior:'smooth',block:'nearest'});},60);
+}
+
+function reLetter() {
+  const L='ABCDEFGHIJKLMNOPQRSTUVWXYZ';
+  sections.forEach((s,i)=>{s.id=L[i]||String(i+1);});
+}
+
+function delSection(uid) {
+  if (!confirm('Delete this entire section and all its questions?')) return;
+  sections=sections.filter(s=>s._uid!==uid);
+  reLetter();
+  const el=$('sec-'+uid); if(el) el.remove();
+  sections.forEach(s=>{ const le=$('sltr-'+s._uid); if(le) le.textContent=s.id; });
+  const emp=$('secs-empty');
+  if (sections.length===0&&emp) emp.style.display='block';
+  updateStats();
+}
+
+function toggleSec(uid) {
+  const sec=getSec(uid); if(!sec) return;
+  sec._open=!sec._open;
+  const body=$('sbody-'+uid), chev=$('schev-'+uid);
+  if(body) body.classList.toggle('open',sec._open);
+  if(chev) chev.classList.toggle('open',sec._open);
+}
+
+function onSecInput(uid,field,val) {
+  const sec=getSec(uid); if(!sec) return;
+  sec[field]=val;
+  // Update header displays
+  const nm=$('sname-'+uid); if(nm) nm.textContent=sec.name||('Section '+sec.id);
+  const mt=$('smeta-'+uid); if(mt) mt.textContent=(sec.questions||[]).length+' question(s)'+(sec.totalMarks?' · '+sec.totalMarks+' marks':'');
+  updateStats();
+}
+
+function insertSecCard(sec) {
+  const emp=$('secs-empty'); if(emp) emp.style.display='none';
+  const container=$('secs-container');
+  const div=document.createElement('div'); div.innerHTML=buildSecHTML(sec);
+  container.appendChild(div.firstElementChild);
+}
+
+function buildSecHTML(sec) {
+  const numStyles=['1, 2, 3...','Q1, Q2, Q3...','i, ii, iii...','(a), (b), (c)...'];
+  return `
+  <div class="sec-card" id="sec-${sec._uid}">
+    <div class="sec-head" onclick="toggleSec(${sec._uid})">
+      <div class="sec-letter" id="sltr-${sec._uid}">${E(sec.id)}</div>
+      <div class="sec-head-inner">
+        <div class="sec-info">
+          <div class="sec-name-disp" id="sname-${sec._uid}">${sec.name||'Section '+sec.id}</div>
+          <div class="sec-meta-disp" id="smeta-${sec._uid}">${(sec.questions||[]).length} question(s)${sec.totalMarks?' · '+sec.totalMarks+' marks':''}</div>
+        </div>
+        <div class="sec-badges" onclick="event.stopPropagation()">
+          <button class="btn btn-ghost btn-xs" onclick="delSection(${sec._uid})">🗑 Delete</button>
+        </div>
+        <span class="sec-chev${sec._open?' open':''}" id="schev-${sec._uid}">▼</span>
+      </div>
+    </div>
+    <div class="sec-body${sec._open?' open':''}" id="sbody-${sec._uid}">
+      <div class="sec-cfg">
+        <div class="fg-grid">
+          <div class="fg">
+            <label class="fl">Section Name</label>
+            <input class="fc" placeholder="e.g. MCQs / Short Answer" value="${E(sec.name)}"
+              oninput="onSecInput(${sec._uid},'name',this.value)"/>
+          </div>
+          <div class="fg">
+            <label class="fl">Section Total Marks</label>
+            <input type="number" class="fc" placeholder="e.g. 20" value="${E(sec.totalMarks)}"
+              oninput="onSecInput(${sec._uid},'totalMarks',this.value)"/>
+          </div>
+          <div class="fg">
+            <label class="fl">Question Numbering</label>
+            <select class="fc" onchange="onSecInput(${sec._uid},'questionNumberStyle',this.value)">
+              ${numStyles.map(s=>`<option value="${s}"${sec.questionNumberStyle===s?' selected':''}>${s}</option>`).join('')}
+            </select>
+          </div>
+          <div class="fg">
+            <label class="fl">Section Instructions</label>
+            <input class="fc" placeholder="e.g. Attempt any 5 questions." value="${E(sec.instructions)}"
+              oninput="onSecInput(${sec._uid},'instructions',this.value)"/>
+          </div>
+        </div>
+      </div>
+      <div class="sec-qs">
+        <div class="row-sb" style="margin-bottom:10px">
+          <div style="font-size:13px;font-weight:700">Questions <span class="muted t-sm" id="sqc-${sec._uid}">(${(sec.questions||[]).length})</span></div>
+          <button class="btn btn-k btn-sm" onclick="openAddQ(${sec._uid})">+ Add Question</button>
+        </div>
+        <div id="qlist-${sec._uid}" class="q-list"></div>
+      </div>
+    </div>
+  </div>`;
+}
+
+// ════════════════════════════════════════════
+// QUESTION RENDERING
+// ════════════════════════════════════════════
+function renderQs(sec) {
+  const list=$('qlist-'+sec._uid), cnt=$('sqc-'+sec._uid), meta=$('smeta-'+sec._uid);
+  if (!list) return;
+  if (cnt) cnt.textContent='('+(sec.questions||[]).length+')';
+  if (meta) meta.textContent=(sec.questions||[]).length+' question(s)'+(sec.totalMarks?' · '+sec.totalMarks+' marks':'');
+
+  if (!sec.questions||sec.questions.length===0) {
+    list.innerHTML=`<div class="empty-qs"><div class="empty-icon">❓</div><div style="font-size:13px;font-weight:600;margin-bottom:3px">No questions yet</div><div class="t-sm">Click <strong>"+ Add Question"</strong> to add your first question here.</div></div>`;
+    return;
+  }
+  list.innerHTML=sec.questions.map((q,qi)=>buildQHTML(q,qi,sec._uid)).join('');
+}
+
+function buildQHTML(q,qi,suid) {
+  const type=q.type||'sa';
+  let body='';
+
+  // Passage / Case
+  if ((type==='comp'||type==='case')&&(q.passage||q.caseText)) {
+    const txt=(q.passage||q.caseText||'');
+    body+=`<div class="detail-block"><div class="detail-lbl">${type==='comp'?'Passage':'Case Text'}</div><div class="passage-box">${E(txt.substring(0,220))}${txt.length>220?'…':''}</div></div>`;
+  }
+  // A-R
+  if (type==='ar'&&(q.assertion||q.reason)) {
+    body+=`<div class="detail-block ar-block">${q.assertion?`<div><strong>Assertion (A):</strong> ${E(q.assertion)}</div>`:''} ${q.reason?`<div><strong>Reason (R):</strong> ${E(q.reason)}</div>`:''}</div>`;
+  }
+  // MCQ Options
+  if (type==='mcq'&&q.options&&q.options.length) {
+    const L=['A','B','C','D','E','F'], corr=q.correctAnswers||[];
+    body+=`<div class="detail-block"><div class="detail-lbl">Options</div><div class="opts-grid">${q.options.map((o,oi)=>`<div class="opt-row"><div class="opt-ltr">${L[oi]||oi+1}.</div><div class="${corr.includes(oi)?'opt-correct':'opt-txt'}">${E(o)}${corr.includes(oi)?' ✓':''}</div></div>`).join('')}</div></div>`;
+  }
+  // Fill blanks
+  if (type==='fill_blanks'&&q.blanks&&q.blanks.filter(Boolean).length) {
+    body+=`<div class="detail-block"><div class="detail-lbl">Statements</div><div class="fill-stmts">${q.blanks.filter(Boolean).map((b,bi)=>`<div class="fill-stmt">${bi+1}. ${E(b)}</div>`).join('')}</div></div>`;
+  }
+  // Match
+  if (type==='match'&&((q.columnA&&q.columnA.length)||(q.columnB&&q.columnB.length))) {
+    const mlen=Math.max((q.columnA||[]).length,(q.columnB||[]).length);
+    body+=`<div class="detail-block"><div class="detail-lbl">Columns</div><div class="match-grid"><div class="match-col-hdr">Column A</div><div class="match-col-hdr">Column B</div>${Array.from({length:mlen},(_,i)=>`<div class="match-row">${i+1}. ${E((q.columnA||[])[i]||'')}</div><div class="match-row">${String.fromCharCode(65+i)}. ${E((q.columnB||[])[i]||'')}</div>`).join('')}</div></div>`;
+  }
+  // Parts
+  if (q.parts&&q.parts.length) {
+    body+=`<div class="detail-block"><div class="detail-lbl">Parts (${q.parts.length})</div><div class="parts-list">${q.parts.map((p,pi)=>`<div class="part-disp"><div class="part-disp-lbl">(${String.fromCharCode(97+pi)})</div><div class="part-disp-txt">${E(p.text||'')}</div>${p.marks?`<div class="part-disp-m">[${p.marks}]</div>`:''}</div>`).join('')}</div></div>`;
+  }
+  // Answer lines note
+  if (q.answerLines&&parseInt(q.answerLines)>0) {
+    body+=`<div class="t-sm muted" style="margin-top:5px">📏 ${q.answerLines} answer line(s)</div>`;
+  }
+
+  return `
+  <div class="q-item" id="qi-${suid}-${qi}">
+    <div class="q-head">
+      <div class="q-circle">${qi+1}</div>
+      <div class="q-hc">
+        <div class="q-text-disp">${E(q.text||'(No question text)')}</div>
+        <div class="q-meta">
+          <span class="q-type-tag qtag-${type}">${qtl(type)}</span>
+          ${q.marks?`<span class="marks-tag">[${q.marks} mark${parseFloat(q.marks)!==1?'s':''}]</span>`:''}
+          ${(q.parts||[]).length?`<span class="meta-note">${q.parts.length} part(s)</span>`:''}
+          ${type==='mcq'&&q.options?`<span class="meta-note">${q.options.length} options</span>`:''}
+          ${q.answerLines&&q.answerLines>0?`<span class="meta-note">${q.answerLines} lines</span>`:''}
+        </div>
+      </div>
+      <div class="q-acts">
+        <button class="icon-btn" onclick="openEditQ(${suid},${qi})" title="Edit">✏️</button>
+        <button class="icon-btn" onclick="dupQ(${suid},${qi})" title="Duplicate">⧉</button>
+        <button class="icon-btn" style="color:#b00" onclick="delQ(${suid},${qi})" title="Delete">🗑</button>
+      </div>
+    </div>
+    ${body?`<div class="q-body">${body}</div>`:''}
+  </div>`;
+}
+
+function dupQ(suid,qi) {
+  const sec=getSec(suid); if(!sec) return;
+  sec.questions.splice(qi+1,0,JSON.parse(JSON.stringify(sec.questions[qi])));
+  renderQs(sec); updateStats(); toast('Question duplicated');
+}
+function delQ(suid,qi) {
+  const sec=getSec(suid); if(!sec) return;
+  sec.questions.splice(qi,1); renderQs(sec); updateStats(); toast('Question deleted');
+}
+
+// ════════════════════════════════════════════
+// MODAL
+// ════════════════════════════════════════════
+function openAddQ(suid) {
+  ms={suid,editIdx:null,qtype:'mcq'};
+  $('modal-title-text').textContent='Add Question';
+  buildModalHTML({type:'mcq',text:'',marks:1,answerLines:0,options:['','','',''],correctAnswers:[],parts:[]});
+  $('q-modal').classList.add('open');
+}
+function openEditQ(suid,qi) {
+  const sec=getSec(suid); if(!sec) return;
+  const q=JSON.parse(JSON.stringify(sec.questions[qi]));
+  ms={suid,editIdx:qi,qtype:q.type||'mcq'};
+  $('modal-title-text').textContent='Edit Question';
+  buildModalHTML(q);
+  $('q-modal').classList.add('open');
+}
+function closeModal() { $('q-modal').classList.remove('open'); }
+function bgClose(e) { if(e.target===$('q-modal')) closeModal(); }
+
+function buildModalHTML(q) {
+  const type=q.type||ms.qtype;
+  ms.qtype=type;
+  const picker=QT.map(t=>`
+    <div class="type-tile${t.k===type?' sel':''}" onclick="changeType('${t.k}')" data-type="${t.k}">
+      <div class="tt-icon">${t.i}</div>
+      <div class="tt-name">${t.l}</div>
+    </div>`).join('');
+
+  $('modal-content').innerHTML=`
+    <div class="fg" style="margin-bottom:14px">
+      <label class="fl">Question Type</label>
+      <div class="type-grid mt6">${picker}</div>
+    </div>
+    <div class="fg" style="margin-bottom:12px">
+      <label class="fl">Question Text *</label>
+      <textarea class="fc" id="q-text" rows="3" placeholder="Enter full question text here…">${E(q.text||'')}</textarea>
+    </div>
+    <div class="fg-2" style="margin-bottom:12px">
+      <div class="fg"><label class="fl">Marks</label><input type="number" class="fc" id="q-marks" value="${q.marks??1}" min="0" step="0.5"/></div>
+      <div class="fg"><label class="fl">Answer Lines (printed)</label><input type="number" class="fc" id="q-lines" value="${q.answerLines||0}" min="0" max="25"/></div>
+    </div>
+    <div id="type-spec">${buildTypeSpec(type,q)}</div>
+    <div class="sep-dashed" style="margin:14px 0"></div>
+    <div class="row-sb" style="margin-bottom:8px">
+      <div class="fl" style="margin:0">Parts (a), (b)… <span style="font-weight:400;text-transform:none;color:var(--g5)">optional sub-questions</span></div>
+      <button class="btn btn-ghost btn-xs" onclick="addPart()">+ Add Part</button>
+    </div>
+    <div id="modal-parts" class="parts-editor">
+      ${(q.parts||[]).map((p,pi)=>buildPartHTML(p,pi)).join('')}
+    </div>
+    ${!(q.parts&&q.parts.length)?'<div class="t-sm muted" id="no-parts-msg">No parts added.</div>':''}
+  `;
+}
+
+function buildTypeSpec(type,q) {
+  if (type==='mcq') {
+    const opts=q.options&&q.options.length?q.options:['','','',''];
+    const corr=q.correctAnswers||[];
+    return `<div class="fl" style="margin-bottom:7px">Options — click "Mark ✓" to set correct answer</div>
+      <div class="opts-editor" id="opts-editor">${opts.map((o,oi)=>buildOptRow(o,oi,corr.includes(oi))).join('')}</div>
+      <button class="btn btn-ghost btn-xs" style="margin-top:7px" onclick="addOpt()">+ Add Option</button>`;
+  }
+  if (type==='fill_blanks') {
+    const blanks=q.blanks&&q.blanks.length?q.blanks:[''];
+    return `<div class="fl" style="margin-bottom:7px">Blank Statements (use ___ where blanks go)</div>
+      <div id="blanks-ed" style="display:flex;flex-direction:column;gap:5px">
+        ${blanks.map((b,bi)=>`<div class="opt-edit-row"><div class="opt-ltr-badge" style="border-radius:4px;font-size:11px">${bi+1}</div><input class="fc" data-blank="${bi}" value="${E(b)}" placeholder="The symbol of water is ___."/><button class="icon-btn" onclick="rmBlank(this)">✕</button></div>`).join('')}
+      </div>
+      <button class="btn btn-ghost btn-xs" style="margin-top:7px" onclick="addBlank()">+ Add Statement</button>`;
+  }
+  if (type==='match') {
+    const A=q.columnA&&q.columnA.length?q.columnA:['',''];
+    const B=q.columnB&&q.columnB.length?q.columnB:['',''];
+    return `<div style="display:grid;grid-template-columns:1fr 1fr;gap:10px">
+      <div><div class="fl" style="margin-bottom:6px">Column A</div><div id="cola-ed" style="display:flex;flex-direction:column;gap:5px">${A.map((item,i)=>`<input class="fc" data-cola="${i}" value="${E(item)}" placeholder="Item ${i+1}"/>`).join('')}</div></div>
+      <div><div class="fl" style="margin-bottom:6px">Column B</div><div id="colb-ed" style="display:flex;flex-direction:column;gap:5px">${B.map((item,i)=>`<input class="fc" data-colb="${i}" value="${E(item)}" placeholder="Item ${i+1}"/>`).join('')}</div></div>
+    </div><button class="btn btn-ghost btn-xs" style="margin-top:7px" onclick="addMatchRow()">+ Add Row</button>`;
+  }
+  if (type==='ar') {
+    return `<div class="fg" style="margin-bottom:10px"><label class="fl">Assertion (A)</label><textarea class="fc" id="q-ar-a" rows="2" placeholder="Write the assertion…">${E(q.assertion||'')}</textarea></div>
+      <div class="fg"><label class="fl">Reason (R)</label><textarea class="fc" id="q-ar-r" rows="2" placeholder="Write the reason…">${E(q.reason||'')}</textarea></div>`;
+  }
+  if (type==='comp') return `<div class="fg"><label class="fl">Passage Text (300-500 words)</label><textarea class="fc" id="q-passage" rows="6" placeholder="Paste reading passage here…">${E(q.passage||'')}</textarea></div>`;
+  if (type==='case') return `<div class="fg"><label class="fl">Case / Paragraph Text</label><textarea class="fc" id="q-case" rows="5" placeholder="Write the case study…">${E(q.caseText||'')}</textarea></div>`;
+  return '';
+}
+
+function buildOptRow(val,idx,isCorrect) {
+  const L=['A','B','C','D','E','F'];
+  return `<div class="opt-edit-row${isCorrect?' is-correct':''}" id="or-${idx}">
+    <div class="opt-ltr-badge">${L[idx]||idx+1}</div>
+    <input class="fc" data-opt="${idx}" value="${E(val)}" placeholder="Option ${L[idx]||idx+1}"/>
+    <button class="opt-correct-btn" onclick="toggleCorr(${idx})">${isCorrect?'✓ Correct':'Mark ✓'}</button>
+    <button class="icon-btn" onclick="rmOpt(${idx})">✕</button>
+  </div>`;
+}
+function buildPartHTML(p,pi) {
+  return `<div class="part-card" id="pc-${pi}">
+    <div class="part-card-h"><span class="part-card-lbl">Part (${String.fromCharCode(97+pi)})</span><button class="icon-btn btn-xs" onclick="rmPart(${pi})">🗑 Remove</button></div>
+    <div class="part-card-b">
+      <div class="fg"><label class="fl">Part Text</label><textarea class="fc" data-pt="${pi}" rows="2" placeholder="Sub-question text…">${E(p.text||'')}</textarea></div>
+      <div class="fg"><label class="fl">Marks</label><input type="number" class="fc" data-pm="${pi}" value="${p.marks||''}" step="0.5" placeholder="—"/></div>
+    </div>
+  </div>`;
+}
+
+function changeType(type) {
+  ms.qtype=type;
+  const cur=collectQ(); cur.type=type;
+  document.querySelectorAll('#q-modal .type-tile').forEach(el=>el.classList.toggle('sel',el.dataset.type===type));
+  $('type-spec').innerHTML=buildTypeSpec(type,cur);
+}
+
+// Options
+function toggleCorr(idx) {
+  const row=$('or-'+idx); if(!row) return;
+  const now=row.classList.toggle('is-correct');
+  row.querySelector('.opt-correct-btn').textContent=now?'✓ Correct':'Mark ✓';
+}
+function addOpt() {
+  const ed=$('opts-editor'), idx=ed.querySelectorAll('[data-opt]').length;
+  const d=document.createElement('div'); d.innerHTML=buildOptRow('',idx,false);
+  ed.appendChild(d.firstElementChild);
+}
+function rmOpt(idx) {
+  const row=$('or-'+idx); if(row) row.remove();
+  $('opts-editor').querySelectorAll('.opt-edit-row').forEach((r,i)=>{
+    r.id='or-'+i;
+    const L=['A','B','C','D','E','F'];
+    r.querySelector('.opt-ltr-badge').textContent=L[i]||i+1;
+    const inp=r.querySelector('[data-opt]'); if(inp) inp.dataset.opt=i;
+    r.querySelector('.opt-correct-btn').setAttribute('onclick',`toggleCorr(${i})`);
+    r.querySelector('.icon-btn').setAttribute('onclick',`rmOpt(${i})`);
+  });
+}
+function addBlank() {
+  const ed=$('blanks-ed'), idx=ed.querySelectorAll('[data-blank]').length;
+  const d=document.createElement('div'); d.className='opt-edit-row';
+  d.innerHTML=`<div class="opt-ltr-badge" style="border-radius:4px;font-size:11px">${idx+1}</div><input class="fc" data-blank="${idx}" placeholder="Statement with ___ for blanks"/><button class="icon-btn" onclick="rmBlank(this)">✕</button>`;
+  ed.appendChild(d);
+}
+function rmBlank(btn) { btn.closest('.opt-edit-row').remove(); }
+function addMatchRow() {
+  const A=$('cola-ed'), B=$('colb-ed'), idx=A.querySelectorAll('[data-cola]').length;
+  const ia=document.createElement('input'); ia.className='fc'; ia.dataset.cola=idx; ia.placeholder=`Item ${idx+1}`; A.appendChild(ia);
+  const ib=document.createElement('input'); ib.className='fc'; ib.dataset.colb=idx; ib.placeholder=`Item ${idx+1}`; B.appendChild(ib);
+}
+function addPart() {
+  const c=$('modal-parts'), idx=c.querySelectorAll('.part-card').length;
+  const msg=$('no-parts-msg'); if(msg) msg.remove();
+  const d=document.createElement('div'); d.innerHTML=buildPartHTML({text:'',marks:''},idx);
+  c.appendChild(d.firstElementChild);
+}
+function rmPart(pi) {
+  const card=$('pc-'+pi); if(card) card.remove();
+  $('modal-parts').querySelectorAll('.part-card').forEach((c,i)=>{
+    c.id='pc-'+i;
+    c.querySelector('.part-card-lbl').textContent=`Part (${String.fromCharCode(97+i)})`;
+    c.querySelector('.icon-btn').setAttribute('onclick',`rmPart(${i})`);
+    const ta=c.querySelector('[data-pt]'); if(ta) ta.dataset.pt=i;
+    const inp=c.querySelector('[data-pm]'); if(inp) inp.dataset.pm=i;
+  });
+}
+
+function collectQ() {
+  const q={};
+  q.type=ms.qtype;
+  q.text=($('q-text')?.value||'').trim();
+  q.marks=parseFloat($('q-marks')?.value)||0;
+  q.answerLines=parseInt($('q-lines')?.value)||0;
+  if (q.type==='mcq') {
+    q.options=Array.from(document.querySelectorAll('#opts-editor [data-opt]')).map(el=>el.value);
+    q.correctAnswers=Array.from(document.querySelectorAll('#opts-editor .opt-edit-row.is-correct')).map(r=>{const i=r.querySelector('[data-opt]');return i?parseInt(i.dataset.opt):-1;}).filter(n=>n>=0);
+  } else if (q.type==='fill_blanks') {
+    q.blanks=Array.from(document.querySelectorAll('#blanks-ed [data-blank]')).map(el=>el.value);
+  } else if (q.type==='match') {
+    q.columnA=Array.from(document.querySelectorAll('#cola-ed [data-cola]')).map(el=>el.value);
+    q.columnB=Array.from(document.querySelectorAll('#colb-ed [data-colb]')).map(el=>el.value);
+  } else if (q.type==='ar') {
+    q.assertion=$('q-ar-a')?.value||''; q.reason=$('q-ar-r')?.value||'';
+  } else if (q.type==='comp') { q.passage=$('q-passage')?.value||''; }
+  else if (q.type==='case')   { q.caseText=$('q-case')?.value||''; }
+  q.parts=[];
+  document.querySelectorAll('#modal-parts .part-card').forEach(c=>{
+    const ta=c.querySelector('[data-pt]'), inp=c.querySelector('[data-pm]');
+    q.parts.push({text:ta?.value||'',marks:parseFloat(inp?.value)||''});
+  });
+  return q;
+}
+
+function saveQ() {
+  const q=collectQ();
+  if (!q.text) { toast('Please enter question text','err'); return; }
+  const sec=getSec(ms.suid); if(!sec){toast('Section not found','err');return;}
+  if (ms.editIdx!==null) { sec.questions[ms.editIdx]=q; toast('Question updated ✓','ok'); }
+  else { sec.questions.push(q); toast('Question added ✓','ok'); }
+  closeModal(); renderQs(sec); updateStats();
+}
+
+// ════════════════════════════════════════════
+// INSTRUCTIONS
+// ════════════════════════════════════════════
+function renderPresets() {
+  const wrap=$('preset-wrap'); if(!wrap) return;
+  wrap.innerHTML=PRESETS.map(p=>{
+    const used=instrs.includes(p);
+    return `<div class="preset-chip${used?' used':''}" onclick="${used?'':'addInstr('+JSON.stringify(p)+')'}" title="${E(p)}">${E(p.substring(0,55))}${p.length>55?'…':''}</div>`;
+  }).join('');
+}
+function renderInstrs() {
+  const list=$('instr-list'), emp=$('instr-empty'); if(!list) return;
+  if (!instrs.length) { list.innerHTML=''; if(emp) emp.style.display='block'; return; }
+  if(emp) emp.style.display='none';
+  list.innerHTML=instrs.map((s,i)=>`
+    <div class="instr-row" id="ir-${i}">
+      <div class="instr-num">${i+1}.</div>
+      <input class="fc" value="${E(s)}" oninput="instrs[${i}]=this.value;renderPresets()"/>
+      <button class="icon-btn" onclick="rmInstr(${i})">✕</button>
+    </div>`).join('');
+}
+function addInstr(text) {
+  instrs.push(text||''); renderPresets(); renderInstrs();
+  if (!text) setTimeout(()=>{const inputs=document.querySelectorAll('#instr-list input');if(inputs.length)inputs[inputs.length-1].focus();},40);
+}
+function rmInstr(i) { instrs.splice(i,1); renderPresets(); renderInstrs(); }
+
+// ════════════════════════════════════════════
+// PREVIEW
+// ════════════════════════════════════════════
+function renderPreview() {
+  const el=$('preview-out');
+  const school=$('schoolName').value, exam=$('examType').value;
+  const a1=$('schoolAddr1').value, a2=$('schoolAddr2').value;
+  const cls=$('classGrade').value, subj=$('subject').value;
+  const code=$('subjectCode').value, set=$('paperSet').value;
+  const maxM=getMaxMarks(), dur=getDurMins(), ay=$('academicYear').value;
+
+  let h='';
+  if(school) h+=`<div class="pv-school">${E(school)}</div>`;
+  if(exam)   h+=`<div class="pv-exam">${E(exam)}</div>`;
+  const addr=[a1,a2].filter(Boolean).join(', ');
+  if(addr)   h+=`<div class="pv-addr">${E(addr)}</div>`;
+  h+=`<div class="pv-rule"></div>`;
+  const mp=[];
+  if(cls)  mp.push('Class: '+cls);
+  if(subj) mp.push('Subject: '+subj+(code?' ('+code+')':''));
+  if(set)  mp.push('Set: '+set);
+  if(maxM) mp.push('Max. Marks: '+maxM);
+  if(dur)  mp.push('Time: '+durStr(dur));
+  if(ay)   mp.push('Academic Year: '+ay);
+  if(mp.length) h+=`<div class="pv-meta">${mp.join(' &ensp;|&ensp; ')}</div>`;
+  h+=`<div class="pv-rule"></div>`;
+  if(instrs.length) {
+    h+=`<div class="pv-ih">General Instructions:</div><ol class="pv-il">${instrs.map(i=>`<li>${E(i)}</li>`).join('')}</ol>`;
+    h+=`<div class="pv-rule" style="margin-top:8px"></div>`;
+  }
+
+  let qc=1;
+  sections.forEach(sec=>{
+    h+=`<div class="pv-sec">Section ${sec.id}${sec.name?' — '+sec.name:''}${sec.totalMarks?' ['+sec.totalMarks+' Marks]':''}</div>`;
+    if(sec.instructions) h+=`<div class="pv-si">${E(sec.instructions)}</div>`;
+    (sec.questions||[]).forEach(q=>{
+      const qn=fmtQNum(qc++,sec.questionNumberStyle);
+      h+=`<div class="pv-qr"><div class="pv-qnum">${qn}</div><div class="pv-qb"><div class="pv-qt">${E(q.text||'')}</div>`;
+      if(q.type==='mcq'&&q.options) h+=`<div class="pv-opts">${q.options.map((o,oi)=>`<span>(${String.fromCharCode(97+oi)}) ${E(o)}</span>`).join('')}</div>`;
+      else if(q.type==='ar') h+=`<div style="font-size:10pt;margin-top:4px"><strong>A:</strong> ${E(q.assertion||'')}</div><div style="font-size:10pt"><strong>R:</strong> ${E(q.reason||'')}</div>`;
+      else if((q.type==='comp'||q.type==='case')&&(q.passage||q.caseText)) h+=`<div class="pv-passage">${E((q.passage||q.caseText||'').substring(0,250))}…</div>`;
+      if(q.parts&&q.parts.length) h+=`<div class="pv-parts">${q.parts.map((p,pi)=>`<div class="pv-part"><span style="font-weight:bold">(${String.fromCharCode(97+pi)})</span><span style="flex:1;margin-left:4px">${E(p.text||'')}</span>${p.marks?`<span style="font-style:italic">[${p.marks}]</span>`:''}</div>`).join('')}</div>`;
+      h+=`</div><div class="pv-qm">${q.marks?'['+q.marks+']':''}</div></div>`;
+    });
+  });
+  if(!sections.length) h='<div style="text-align:center;padding:60px 20px;color:#999;font-family:sans-serif;font-size:13px"><div style="font-size:28px;margin-bottom:10px">📄</div>Add sections and questions to see a preview.</div>';
+  el.innerHTML=h;
+}
+
+// ════════════════════════════════════════════
+// GENERATE
+// ════════════════════════════════════════════
+function buildJSON() {
+  return {
+    metadata:{
+      schoolName:$('schoolName').value, schoolAddressLine1:$('schoolAddr1').value,
+      schoolAddressLine2:$('schoolAddr2').value, class:$('classGrade').value,
+      subject:$('subject').value, subjectCode:$('subjectCode').value,
+      examType:$('examType').value, set:$('paperSet').value,
+      maxMarks:getMaxMarks(), durationMinutes:getDurMins(), academicYear:$('academicYear').value
+    },
+    instructions:instrs.slice(),
+    sections:sections.map(s=>({id:s.id,name:s.name,totalMarks:s.totalMarks,instructions:s.instructions,questionNumberStyle:s.questionNumberStyle,enabled:s.enabled!==false,questions:(s.questions||[]).slice()}))
+  };
+}
+
+async function generateDocx() {
+  const m=buildJSON().metadata;
+  if(!m.schoolName){toast('Please enter School Name first','err');showStep(1);return;}
+  const loader=$('loader'); loader.classList.add('show');
+  try {
+    const r=await fetch('/api/paper/generate',{method:'POST',headers:{'Content-Type':'application/json'},body:JSON.stringify(buildJSON())});
+    if(!r.ok){const e=await r.json().catch(()=>({}));throw new Error(e.error||'Server error');}
+    const blob=await r.blob(), url=URL.createObjectURL(blob);
+    const a=document.createElement('a'); a.href=url;
+    a.download=[m.schoolName,m.subject,m.examType].filter(Boolean).join('_').replace(/\s+/g,'_')+'.docx';
+    document.body.appendChild(a); a.click();
+    setTimeout(()=>{URL.revokeObjectURL(url);a.remove();},1000);
+    toast('Download started ✓','ok');
+  } catch(e){toast('Error: '+e.message,'err');console.error(e);}
+  finally{loader.classList.remove('show');}
+}
+
+// ════════════════════════════════════════════
+// SAVE / LOAD / CLEAR
+// ════════════════════════════════════════════
+function saveToLocal() {
+  try{localStorage.setItem('ec_draft',JSON.stringify(buildJSON()));toast('Draft saved ✓','ok');}
+  catch(e){toast('Save failed','err');}
+}
+function loadFromLocal() {
+  try{
+    const raw=localStorage.getItem('ec_draft');
+    if(!raw){toast('No saved draft found','err');return;}
+    loadJSON(JSON.parse(raw)); toast('Draft loaded ✓','ok');
+  }catch(e){toast('Load failed','err');}
+}
+function loadJSON(paper) {
+  const m=paper.metadata||{};
+  ['schoolName','schoolAddr1','schoolAddr2','subjectCode','academicYear'].forEach(id=>{
+    const fmap={schoolName:'schoolName',schoolAddr1:'schoolAddressLine1',schoolAddr2:'schoolAddressLine2',subjectCode:'subjectCode',academicYear:'academicYear'};
+    const val=m[id]||m[fmap[id]]||''; $(id).value=val;
+  });
+  $('schoolAddr1').value=m.schoolAddressLine1||'';
+  $('schoolAddr2').value=m.schoolAddressLine2||'';
+  $('classGrade').value=m.class||'';
+  $('examType').value=m.examType||'';
+  $('paperSet').value=m.set||'';
+  const ss=$('subject'); for(const o of ss.options){if(o.value===m.subject){ss.value=m.subject;break;}}
+  const mo=new Set(['100','80','70','50','40','30','20']);
+  if(mo.has(String(m.maxMarks))){$('maxMarks').value=String(m.maxMarks);}
+  else if(m.maxMarks){$('maxMarks').value='custom';$('custMarks').value=m.maxMarks;$('custMarksG').style.display='flex';}
+  const do2=new Set(['60','90','120','180']);
+  if(do2.has(String(m.durationMinutes))){$('duration').value=String(m.durationMinutes);}
+  else if(m.durationMinutes){$('duration').value='custom';$('custDur').value=m.durationMinutes;$('custDurG').style.display='flex';}
+  instrs=paper.instructions||[];
+  secUid=0; sections=[]; $('secs-container').innerHTML=''; $('secs-empty').style.display='none';
+  (paper.sections||[]).forEach(sec=>{
+    const uid=++secUid;
+    sections.push({...sec,_uid:uid,_open:false,questions:sec.questions||[]});
+    insertSecCard(sections[sections.length-1]);
+  });
+  sections.forEach(sec=>renderQs(sec));
+  renderPresets(); renderInstrs(); updateStats();
+}
+function clearAll() {
+  if(!confirm('Clear everything?')) return;
+  sections=[]; instrs=[]; secUid=0;
+  ['schoolName','schoolAddr1','schoolAddr2','subjectCode','academicYear'].forEach(id=>$(id).value='');
+  ['classGrade','subject','examType','paperSet'].forEach(id=>$(id).value='');
+  $('maxMarks').value='100'; $('duration').value='180';
+  $('secs-container').innerHTML=''; $('secs-empty').style.display='block';
+  renderPresets(); renderInstrs(); updateStats(); toast('Cleared');
+}
+
+// ════════════════════════════════════════════
+// INIT
+// ════════════════════════════════════════════
+document.addEventListener('DOMContentLoaded',()=>{
+  const now=new Date(), yr=now.getFullYear(), mo=now.getMonth();
+  $('academicYear').value=mo>=3?`${yr}–${yr+1}`:`${yr-1}–${yr}`;
+  renderPresets(); renderInstrs(); updateStats();
+  document.addEventListener('keydown',e=>{
+    if((e.ctrlKey||e.metaKey)&&e.key==='s'){e.preventDefault();saveToLocal();}
+    if(e.key==='Escape') closeModal();
+  });
+});
@@ -0,0 +1,93 @@
+import gzip
+import hashlib
+import os
+
+from flask import Response, abort, request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+ASSET_MAX_AGE = 31536000
+
+# Among codings with the same q-value, the smallest body wins.
+ENCODING_PREFERENCE = {'br': 2, 'gzip': 1, 'identity': 0}
+
+
+def encoding_quality(accepted, encoding):
+    # An explicit entry beats '*'; identity stays acceptable unless ruled out.
+    for value, quality in accepted:
+        if value.lower() == encoding:
+            return quality
+    for value, quality in accepted:
+        if value == '*':
+            return quality
+    return 1 if encoding == 'identity' else 0
+
+
+class CachedBody:
+    """A response body kept in memory alongside its precompressed variants."""
+
+    def __init__(self, body, mimetype):
+        self.mimetype = mimetype
+        self.digest = hashlib.sha256(body).hexdigest()[:16]
+        self.variants = {'identity': body}
+        gz = gzip.compress(body, compresslevel=9, mtime=0)
+        if len(gz) < len(body):
+            self.variants['gzip'] = gz
+        if brotli is not None:
+            br = brotli.compress(body, quality=11)
+            if len(br) < len(body):
+                self.variants['br'] = br
+
+    def pick_encoding(self):
+        accepted = request.accept_encodings
+        quality, _, encoding = max(
+            (encoding_quality(accepted, encoding), ENCODING_PREFERENCE[encoding], encoding)
+            for encoding in self.variants
+        )
+        return encoding if quality > 0 else None
+
+    def response(self, cache_control):
+        encoding = self.pick_encoding()
+        if encoding is None:
+            abort(406)
+        resp = Response(self.variants[encoding], mimetype=self.mimetype)
+        if encoding != 'identity':
+            resp.headers['Content-Encoding'] = encoding
+        resp.headers['Vary'] = 'Accept-Encoding'
+        resp.headers['Cache-Control'] = cache_control
+        # Each encoding is a different byte sequence, so it needs its own strong ETag.
+        resp.set_etag(self.digest if encoding == 'identity' else f'{self.digest}-{encoding}')
+        return resp.make_conditional(request)
+
+
+class AssetRegistry:
+    """Loads files from the static folder and serves them under fingerprinted names."""
+
+    def __init__(self, static_folder, names):
+        self.urls = {}
+        self.assets = {}
+        self.paths = []
+        for name in names:
+            path = os.path.join(static_folder, name)
+            self.paths.append(path)
+            with open(path, 'rb') as f:
+                body = f.read()
+            mimetype = 'text/css' if name.endswith('.css') else 'application/javascript'
+            asset = CachedBody(body, mimetype)
+            stem, ext = os.path.splitext(name)
+            fingerprinted = f'{stem}.{asset.digest}{ext}'
+            self.urls[name] = fingerprinted
+            self.assets[fingerprinted] = asset
+
+    def url_for(self, name):
+        return '/assets/' + self.urls[name]
+
+    def response(self, fingerprinted):
+        asset = self.assets.get(fingerprinted)
+        if asset is None:
+            return None
+        return asset.response(f'public, max-age={ASSET_MAX_AGE}, immutable')
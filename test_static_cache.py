@@ -0,0 +1,85 @@
+import re
+
+import pytest
+
+from app import app, assets
+from static_cache import CachedBody
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+@pytest.fixture
+def body():
+    # Stand in a br variant so negotiation is covered without the brotli package.
+    cached = CachedBody(b'x' * 1000, 'text/plain')
+    cached.variants['br'] = b'br-bytes'
+    return cached
+
+
+@pytest.mark.parametrize('header, expected', [
+    (None, 'identity'),
+    ('gzip', 'gzip'),
+    ('gzip, br', 'br'),
+    ('br;q=0.1, gzip;q=1', 'gzip'),
+    ('gzip;q=0, *', 'br'),
+    ('identity', 'identity'),
+    ('*;q=0.5, identity;q=0', 'br'),
+])
+def test_pick_encoding(body, header, expected):
+    headers = {} if header is None else {'Accept-Encoding': header}
+    with app.test_request_context(headers=headers):
+        assert body.pick_encoding() == expected
+
+
+def test_nothing_acceptable_is_406(client):
+    resp = client.get('/api/subjects', headers={'Accept-Encoding': 'identity;q=0, *;q=0'})
+    assert resp.status_code == 406
+
+
+def test_gzip_response_headers(client):
+    resp = client.get(assets.url_for('js/app.js'), headers={'Accept-Encoding': 'gzip'})
+    assert resp.status_code == 200
+    assert resp.headers['Content-Encoding'] == 'gzip'
+    assert resp.headers['Vary'] == 'Accept-Encoding'
+    assert resp.headers['ETag'].endswith('-gzip"')
+
+
+def test_identity_without_accept_encoding(client):
+    resp = client.get('/api/subjects')
+    assert 'Content-Encoding' not in resp.headers
+    assert resp.get_json()[0] == {'name': 'Mathematics', 'code': '041'}
+
+
+@pytest.mark.parametrize('url', ['/', '/api/subjects'])
+@pytest.mark.parametrize('encoding', ['gzip', 'identity'])
+def test_matching_etag_is_304(client, url, encoding):
+    headers = {'Accept-Encoding': encoding}
+    first = client.get(url, headers=headers)
+    assert first.headers['Cache-Control'] == 'no-cache'
+    headers['If-None-Match'] = first.headers['ETag']
+    second = client.get(url, headers=headers)
+    assert second.status_code == 304
+    assert second.data == b''
+
+
+@pytest.mark.parametrize('url', [
+    '/assets/css/app.css',
+    '/assets/js/app.js',
+    '/assets/css/app.0000000000000000.css',
+    '/assets/js/missing.js',
+])
+def test_unknown_asset_is_404(client, url):
+    assert client.get(url).status_code == 404
+
+
+def test_page_asset_urls_resolve(client):
+    html = client.get('/').get_data(as_text=True)
+    urls = re.findall(r'(?:href|src)="(/assets/[^"]+)"', html)
+    assert sorted(urls) == sorted([assets.url_for('css/app.css'), assets.url_for('js/app.js')])
+    for url in urls:
+        resp = client.get(url)
+        assert resp.status_code == 200
+        assert resp.headers['Cache-Control'] == 'public, max-age=31536000, immutable'